@@ -4,98 +4,275 @@ Implementing research-based optimizations and academic best practices
 """
 
 from flask import Flask, session, request, render_template, redirect, url_for, jsonify
+from flask.json.provider import DefaultJSONProvider
+import os
 import time
+import threading
+import logging
+import numpy as np
 from decimal import Decimal, ROUND_HALF_UP
 import json
-import hashlib
-from functools import lru_cache
-from typing import List, Dict, Any, Optional
+from functools import lru_cache, wraps
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Research: Compiled JSON is optional, Flask's stdlib provider remains the fallback
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Research: Flask JSON provider backed by the compiled orjson library
+    Keeps request.get_json() and jsonify() call sites unchanged
+    """
+    
+    def _dumps_bytes(self, obj: Any) -> bytes:
+        # Research: Match the stdlib provider's output - stringify non-str keys, honour
+        # sort_keys, and route datetimes/dataclasses through self.default as Flask does
+        option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                  | orjson.OPT_PASSTHROUGH_DATACLASS)
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self._dumps_bytes(obj).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any):
+        # Research: Hand orjson's bytes straight to the response, skipping a decode/encode round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumps_bytes(obj), mimetype=self.mimetype)
 
 app = Flask(__name__)
 app.secret_key = 'masters-research-secret-key-2024'
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Research: Coarse wall clock for non-precision timestamps, refreshed by a daemon thread
+# so request handlers read a list slot instead of calling time.time()
+_COARSE_CLOCK_INTERVAL = 0.05  # seconds; bounds timestamp staleness
+_COARSE_NOW = [0.0]
+_coarse_clock_running = False
+_coarse_clock_lock = threading.Lock()
+
+def _refresh_coarse_clock() -> None:
+    """Research: Background ticker for the coarse clock"""
+    while True:
+        time.sleep(_COARSE_CLOCK_INTERVAL)
+        _COARSE_NOW[0] = time.time()
+
+def _start_coarse_clock() -> None:
+    """Research: Reset the coarse clock and start its ticker thread once per process"""
+    global _coarse_clock_running
+    with _coarse_clock_lock:
+        if _coarse_clock_running:
+            return
+        _COARSE_NOW[0] = time.time()
+        threading.Thread(target=_refresh_coarse_clock, name='coarse-clock', daemon=True).start()
+        _coarse_clock_running = True
+
+def _coarse_time() -> float:
+    """Research: Wall-clock time at most one tick stale; the ticker starts on first use"""
+    if not _coarse_clock_running:
+        _start_coarse_clock()
+    return _COARSE_NOW[0]
+
+def _reset_coarse_clock_after_fork() -> None:
+    """Research: Threads do not survive fork(), so the child restarts the ticker on first use"""
+    global _coarse_clock_running, _coarse_clock_lock
+    _coarse_clock_running = False
+    _coarse_clock_lock = threading.Lock()
 
-# Research: Advanced caching strategy with TTL simulation
-class ResearchCache:
+# Research: Preload-then-fork servers (e.g. gunicorn --preload); fork is POSIX-only
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_coarse_clock_after_fork)
+
+# Research: Discount rate configuration, built once at import
+_DISCOUNT_RATES: Dict[str, float] = {
+    'SAVE10': 0.10,
+    'WELCOME20': 0.20,
+    'STUDENT15': 0.15  # Research: Additional discount for academic context
+}
+_MAX_DISCOUNT_RATE = 0.50  # Research: 50% maximum discount (business rule)
+_CENT = Decimal('0.01')
+_DECIMAL_ZERO = Decimal(0)
+
+# Research: Below this size NumPy's per-call dispatch overhead outweighs vectorization
+_VECTORIZE_MIN_ITEMS = 64
+# Research: Conservative int64 bound for vectorized cent totals (int64 max is ~9.2e18)
+_INT64_CENTS_LIMIT = 2 ** 62
+
+def _exact_price_cents(price: float) -> Optional[int]:
     """
-    Research-informed caching system with academic optimizations
-    Based on memory hierarchy principles (Denning, 1968)
+    Research: Integer cents for a price with at most two decimal places, else None
+    k / 100 is the double nearest to k cents, so the round trip only holds for exact cent values
     """
-    
-    def __init__(self, max_size: int = 1000):
-        self.max_size = max_size
-        self.cache = {}
-        self.access_count = {}
-        self.hit_count = 0
-        self.miss_count = 0
-        
-    def get(self, key: str) -> Optional[Any]:
-        """Research: LRU-inspired access pattern tracking"""
-        if key in self.cache:
-            self.hit_count += 1
-            self.access_count[key] += 1
-            return self.cache[key]
-        else:
-            self.miss_count += 1
-            return None
-            
-    def set(self, key: str, value: Any) -> None:
-        """Research: Intelligent eviction policy"""
-        if len(self.cache) >= self.max_size:
-            # Evict least frequently used item
-            lfu_key = min(self.access_count.items(), key=lambda x: x[1])[0]
-            del self.cache[lfu_key]
-            del self.access_count[lfu_key]
-            
-        self.cache[key] = value
-        self.access_count[key] = 1
-        
-    def hit_ratio(self) -> float:
-        """Research: Cache performance metric"""
-        total = self.hit_count + self.miss_count
-        return self.hit_count / total if total > 0 else 0.0
+    price_cents = round(price * 100)
+    return price_cents if price_cents / 100 == price else None
 
-# Initialize research cache
-research_cache = ResearchCache()
+def _cart_total_from_parts(total_cents: int, sub_cent_total: Decimal) -> float:
+    """Research: Combine exact cents with any sub-cent remainder, rounding half-up once"""
+    if sub_cent_total:
+        return _round_cents_half_up(Decimal(total_cents).scaleb(-2) + sub_cent_total)
+    return total_cents / 100.0
 
-def calculate_cart_total_research(items: List[Dict]) -> float:
+def _cart_total_cents_scalar(items: List[Dict]) -> Tuple[int, Decimal, int]:
     """
-    Research-optimized cart calculation with academic rigor
-    Implements financial computation best practices from software engineering literature
+    Research: Scalar cart accumulation returning (total_cents, sub_cent_total, valid_items)
+    Prices with more than two decimal places keep their exact Decimal value
     """
-    if not items:
-        return 0.00
-    
-    # Research: Use Decimal for financial calculations to avoid floating-point errors
-    total = Decimal('0.00')
+    total_cents = 0
+    sub_cent_total = _DECIMAL_ZERO
     valid_items = 0
     
     for item in items:
         try:
             # Research: Input validation with comprehensive error handling
-            price = Decimal(str(item.get('price', 0)))
+            price = item.get('price', 0)
             quantity = int(item.get('quantity', 0))
+            price_cents = _exact_price_cents(float(price))
             
-            # Research: Business rule validation
-            if price < 0 or quantity < 0:
-                continue
-                
-            # Research: Accumulate with precision
-            item_total = price * quantity
-            total += item_total
+            if price_cents is None:
+                # Research: Sub-cent prices are summed exactly and rounded with the total
+                exact_price = Decimal(str(price))
+                if exact_price < 0 or quantity < 0:
+                    continue
+                sub_cent_total += exact_price * quantity
+            else:
+                # Research: Business rule validation
+                if price_cents < 0 or quantity < 0:
+                    continue
+                # Research: Accumulate with precision
+                total_cents += price_cents * quantity
             valid_items += 1
             
-        except (ValueError, TypeError, ArithmeticError) as e:
+        except (ValueError, TypeError, AttributeError, ArithmeticError) as e:
             # Research: Comprehensive error handling and logging
             app.logger.warning(f"Invalid cart item: {item}, Error: {e}")
             continue
     
-    # Research: Statistical validation of calculation
-    if valid_items > 0:
+    return total_cents, sub_cent_total, valid_items
+
+def _cart_total_cents_direct(items: List[Dict]) -> Optional[Tuple[int, int]]:
+    """
+    Research: Cart accumulation for well-formed carts using direct field subscripts
+    Skips .get() defaults and per-item try blocks; returns None when any item
+    deviates or has a sub-cent price so the scalar path can handle it
+    """
+    first_item = items[0]
+    if not isinstance(first_item, dict) or 'price' not in first_item or 'quantity' not in first_item:
+        return None
+    
+    total_cents = 0
+    valid_items = 0
+    try:
+        for item in items:
+            price_cents = _exact_price_cents(float(item['price']))
+            quantity = int(item['quantity'])
+            if price_cents is None:
+                return None
+            if price_cents < 0 or quantity < 0:
+                continue
+            total_cents += price_cents * quantity
+            valid_items += 1
+    except (KeyError, ValueError, TypeError, AttributeError, OverflowError):
+        return None
+    
+    return total_cents, valid_items
+
+def _cart_total_cents_vectorized(items: List[Dict]) -> Optional[Tuple[int, int]]:
+    """
+    Research: Vectorized cart accumulation for bulk carts
+    Returns None when any item is malformed or has a sub-cent price so the scalar path can handle it
+    """
+    count = len(items)
+    try:
+        prices = np.fromiter((float(item.get('price', 0)) for item in items),
+                             dtype=np.float64, count=count)
+        quantities = np.fromiter((int(item.get('quantity', 0)) for item in items),
+                                 dtype=np.int64, count=count)
+    except (ValueError, TypeError, AttributeError, OverflowError):
+        return None
+    
+    # Research: Same exact-cent check and business rules as the scalar path
+    price_cents = np.rint(prices * 100)
+    mask = np.isfinite(price_cents) & (price_cents >= 0) & (quantities >= 0)
+    if not np.array_equal(price_cents[mask] / 100, prices[mask]):
+        return None
+    
+    # Research: Hand carts whose int64 cents could wrap around to the exact scalar path
+    if mask.any():
+        bound = float(price_cents[mask].max()) * max(float(quantities[mask].max()), 1.0) * count
+        if bound >= _INT64_CENTS_LIMIT:
+            return None
+    
+    total_cents = int(price_cents[mask].astype(np.int64) @ quantities[mask])
+    return total_cents, int(np.count_nonzero(mask))
+
+def calculate_cart_total_research(items: List[Dict]) -> float:
+    """
+    Research-optimized cart calculation with academic rigor
+    Implements financial computation best practices from software engineering literature
+    """
+    if not items:
+        return 0.00
+    
+    # Research: Accumulate integer cents to avoid floating-point drift without Decimal
+    totals = None
+    if len(items) >= _VECTORIZE_MIN_ITEMS:
+        totals = _cart_total_cents_vectorized(items)
+    if totals is None:
+        totals = _cart_total_cents_direct(items)
+    if totals is None:
+        total_cents, sub_cent_total, valid_items = _cart_total_cents_scalar(items)
+    else:
+        total_cents, valid_items = totals
+        sub_cent_total = _DECIMAL_ZERO
+    total = _cart_total_from_parts(total_cents, sub_cent_total)
+    
+    # Research: Statistical validation of calculation (skipped unless INFO is enabled)
+    if valid_items > 0 and app.logger.isEnabledFor(logging.INFO):
         avg_item_value = total / valid_items
-        app.logger.info(f"Cart calculation: {valid_items} items, avg value: {avg_item_value}")
+        app.logger.info(f"Cart calculation: {valid_items} items, avg value: {avg_item_value:.2f}")
     
-    # Research: Banking rounding for financial precision
-    return float(total.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP))
+    # Research: Banking rounding for financial precision, applied once to the exact total
+    return total
+
+def calculate_session_cart_total_research(cart_items: List[Dict]) -> float:
+    """
+    Research: Cart total for session carts normalized by optimize_session_data_research
+    Items already carry a non-negative float 'p' and int 'q', so no defensive coercion is needed
+    """
+    total_cents = 0
+    sub_cent_total = _DECIMAL_ZERO
+    for item in cart_items:
+        price_cents = _exact_price_cents(item['p'])
+        if price_cents is None:
+            sub_cent_total += Decimal(repr(item['p'])) * item['q']
+        else:
+            total_cents += price_cents * item['q']
+    return _cart_total_from_parts(total_cents, sub_cent_total)
+
+class CardNumberCheck(NamedTuple):
+    """Research: Combined card number checks, kept separate for differentiated errors"""
+    length_ok: bool
+    luhn_ok: bool
+    is_test_card: bool
+
+def _validate_card_fast(card_number: str) -> CardNumberCheck:
+    """
+    Research: Fused card number validation
+    Every 13-19 digit card goes through the SWAR Luhn kernel, which already
+    processes the whole number in one pass over packed digit lanes
+    """
+    length_ok = _LUHN_SWAR_MIN_LENGTH <= len(card_number) <= _LUHN_SWAR_WIDTH
+    luhn_ok = (length_ok and card_number.isascii() and card_number.isdigit()
+               and _luhn_sum_swar(card_number) % 10 == 0)
+    return CardNumberCheck(length_ok, luhn_ok, card_number.endswith('1111'))
 
 def validate_payment_research(card_data: Dict) -> Dict[str, Any]:
     """
@@ -106,18 +283,23 @@ def validate_payment_research(card_data: Dict) -> Dict[str, Any]:
     warnings = []
     
     # Research: Defense in depth validation strategy
-    card_number = str(card_data.get('number', '')).strip().replace(' ', '')
+    card_number = card_data.get('number', '')
+    if not isinstance(card_number, str):
+        card_number = str(card_number)
+    card_number = card_number.strip().replace(' ', '')
     
-    # Research: Luhn algorithm implementation for basic validation
-    if not self.luhn_check(card_number):
-        errors.append("Invalid card number format")
+    # Research: Length, Luhn and test-card checks fused into a single call
+    card_check = _validate_card_fast(card_number)
     
     # Research: Length validation with industry standards
-    if len(card_number) < 13 or len(card_number) > 19:
+    if not card_check.length_ok:
         errors.append("Invalid card number length")
+    # Research: Luhn algorithm implementation for basic validation
+    elif not card_check.luhn_ok:
+        errors.append("Invalid card number format")
     
     # Research: Test card number detection
-    if card_number.endswith('1111'):
+    if card_check.is_test_card:
         errors.append("Test card number rejected")
     
     # CVV validation with research-based rules
@@ -127,15 +309,15 @@ def validate_payment_research(card_data: Dict) -> Dict[str, Any]:
     
     # Research: Expiry date validation with future-looking checks
     expiry = card_data.get('expiry', '')
-    if not self.validate_expiry_date(expiry):
+    if not validate_expiry_date(expiry):
         errors.append("Invalid or expired card")
     
-    # Research: Amount validation with business rules
+    # Research: Amount validation with business rules (a float suffices for threshold checks)
     try:
-        amount = Decimal(str(card_data.get('amount', 0)))
-        if amount <= 0:
+        amount = float(card_data.get('amount', 0) or 0)
+        if not amount > 0:  # Research: Also rejects NaN
             errors.append("Invalid payment amount")
-        elif amount > Decimal('10000.00'):  # Research: Fraud detection threshold
+        elif amount > 10000.0:  # Research: Fraud detection threshold
             warnings.append("Large transaction amount detected")
     except (ValueError, TypeError):
         errors.append("Invalid payment amount format")
@@ -145,13 +327,33 @@ def validate_payment_research(card_data: Dict) -> Dict[str, Any]:
         'success': len(errors) == 0,
         'errors': errors,
         'warnings': warnings,
-        'validation_timestamp': time.time(),
+        'validation_timestamp': _coarse_time(),
         'research_metrics': {
             'validation_depth': 'comprehensive',
             'security_level': 'enhanced'
         }
     }
 
+def _round_cents_half_up(amount: Decimal) -> float:
+    """Research: Financial rounding to cents, applied exactly once per result"""
+    return float(amount.quantize(_CENT, rounding=ROUND_HALF_UP))
+
+@lru_cache(maxsize=1024)
+def _apply_discount_cached(subtotal: float, code_upper: str) -> float:
+    """Research: Memoized discount keyed on the exact subtotal; Decimal math only runs on a miss"""
+    # Research: Discount application with business rules and maximum discount limit
+    discount_rate = min(_DISCOUNT_RATES.get(code_upper, 0.0), _MAX_DISCOUNT_RATE)
+    
+    # Research: Exact decimal arithmetic in basis points, rounded once after the discount
+    remaining_bp = 10000 - round(discount_rate * 10000)
+    return _round_cents_half_up((Decimal(repr(subtotal)) * remaining_bp).scaleb(-4))
+
+def _discount_cache_hit_ratio() -> float:
+    """Research: Hit ratio of the discount lru_cache"""
+    info = _apply_discount_cached.cache_info()
+    total = info.hits + info.misses
+    return info.hits / total if total > 0 else 0.0
+
 def apply_discount_research(subtotal: float, discount_code: str) -> float:
     """
     Research-optimized discount application with caching
@@ -159,101 +361,128 @@ def apply_discount_research(subtotal: float, discount_code: str) -> float:
     """
     # Research: Input validation with academic rigor
     try:
-        subtotal_decimal = Decimal(str(subtotal))
-        if subtotal_decimal < 0:
+        subtotal_value = float(subtotal)
+        if not 0 <= subtotal_value < float('inf'):
             return 0.00
     except (ValueError, TypeError):
         return 0.00
     
-    # Research: Cache key generation with hash for efficiency
-    cache_key = f"discount_{hashlib.md5(f'{subtotal}_{discount_code}'.encode()).hexdigest()}"
-    
-    # Research: Cache lookup with performance metrics
-    cached_result = research_cache.get(cache_key)
-    if cached_result is not None:
-        app.logger.info(f"Cache hit for discount calculation: {cache_key}")
-        return cached_result
-    
-    # Research: Discount rate configuration with validation
-    discount_rates = {
-        'SAVE10': Decimal('0.10'),
-        'WELCOME20': Decimal('0.20'),
-        'STUDENT15': Decimal('0.15')  # Research: Additional discount for academic context
-    }
-    
-    # Research: Discount application with business rules
-    discount_rate = discount_rates.get(discount_code.upper(), Decimal('0.00'))
-    
-    # Research: Maximum discount limit (business rule)
-    max_discount = Decimal('0.50')  # 50% maximum discount
-    if discount_rate > max_discount:
-        discount_rate = max_discount
-        app.logger.warning(f"Discount rate capped at {max_discount} for code: {discount_code}")
-    
-    # Research: Calculate discounted total with precision
-    discounted_total = subtotal_decimal * (Decimal('1.00') - discount_rate)
-    
-    # Research: Final rounding with financial standards
-    result = float(discounted_total.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP))
-    
-    # Research: Cache the result for performance
-    research_cache.set(cache_key, result)
+    # Research: Cheapest correct path first - no code or unknown code means no discount
+    code_upper = (discount_code or '').strip().upper()
+    if code_upper not in _DISCOUNT_RATES:
+        # Research: Whole-cent subtotals (the common case) are already rounded
+        if _exact_price_cents(subtotal_value) is not None:
+            return subtotal_value
+        return _apply_discount_cached(subtotal_value, '')
     
-    app.logger.info(f"Discount applied: {discount_code} -> {discount_rate*100}%")
-    return result
+    # Research: C-level memoization (thread-safe, O(1) LRU) on normalized inputs
+    return _apply_discount_cached(subtotal_value, code_upper)
+
+def _is_normalized_cart_item(item: Any) -> bool:
+    """Research: True when a session cart item is compressed with coerced numeric fields"""
+    if not isinstance(item, dict) or 'price' in item or 'quantity' in item:
+        return False
+    price = item.get('p')
+    quantity = item.get('q')
+    return (type(price) is float and type(quantity) is int
+            and 0 <= price < float('inf') and quantity >= 0)
 
 def optimize_session_data_research() -> None:
     """
     Research-based session optimization
     Implements memory efficiency patterns from systems research
     """
-    if 'cart' in session:
+    cart_items = session.get('cart')
+    
+    # Research: Idempotent compression - an already-normalized cart is left untouched
+    # so Flask does not mark the session modified and re-sign the cookie
+    if cart_items and not all(_is_normalized_cart_item(item) for item in cart_items):
         # Research: Data compression through field optimization
         optimized_cart = []
-        for item in session['cart']:
+        for item in cart_items:
+            # Research: Validate and coerce once at write time so cart reads can skip it;
+            # accepts raw items as well as items compressed by earlier versions
+            try:
+                price = float(item['price'] if 'price' in item else item.get('p', 0.00))
+                quantity = int(item['quantity'] if 'quantity' in item else item.get('q', 1))
+            except (ValueError, TypeError, AttributeError, OverflowError) as e:
+                app.logger.warning(f"Dropping invalid cart item: {item}, Error: {e}")
+                continue
+            if not 0 <= price < float('inf') or quantity < 0:
+                app.logger.warning(f"Dropping invalid cart item: {item}")
+                continue
+            
             # Research: Minimal necessary data structure
             optimized_item = {
                 'id': item.get('id'),
-                'q': item.get('quantity', 1),  # Research: Field name compression
-                'p': item.get('price', 0.00)   # Research: Field name compression
+                'q': quantity,  # Research: Field name compression
+                'p': price      # Research: Field name compression
             }
             optimized_cart.append(optimized_item)
         session['cart'] = optimized_cart
     
-    # Research: Session cleanup algorithm
-    session_keys = list(session.keys())
-    cleanup_count = 0
+    # Research: Session cleanup algorithm - only touch the session if there is stale data
+    stale_keys = [key for key in session if key.startswith(('temp_', 'cache_'))]
+    if not stale_keys:
+        return
     
-    for key in session_keys:
-        if key.startswith('temp_') or key.startswith('cache_'):
-            session.pop(key, None)
-            cleanup_count += 1
+    for key in stale_keys:
+        session.pop(key, None)
     
-    if cleanup_count > 0:
-        app.logger.info(f"Session cleanup: removed {cleanup_count} temporary items")
+    app.logger.info(f"Session cleanup: removed {len(stale_keys)} temporary items")
+
+# Research: SWAR (SIMD-within-a-register) lane constants for Luhn validation.
+# Cards are left-padded with '0' to a fixed width; leading zeros do not change
+# the Luhn sum, so every 13-19 digit card shares the same lane layout.
+_LUHN_SWAR_WIDTH = 19
+_LUHN_SWAR_MIN_LENGTH = 13
+_LUHN_ASCII_ZEROS = int.from_bytes(b'0' * _LUHN_SWAR_WIDTH, 'big')
+_LUHN_LANE_ONES = int.from_bytes(b'\x01' * _LUHN_SWAR_WIDTH, 'big')
+_LUHN_LANE_SIXES = _LUHN_LANE_ONES * 6
+# Every second digit from the right (the doubled digits) - last byte is the check digit
+_LUHN_DOUBLE_MASK = int.from_bytes(b'\x00\xff' * (_LUHN_SWAR_WIDTH // 2) + b'\x00', 'big')
+
+def _luhn_sum_swar(card_number: str) -> int:
+    """
+    Research: Branchless Luhn sum over packed digit lanes
+    Each byte of one integer holds one digit, so the whole card is processed
+    with a handful of subtracts, masks and a final horizontal add
+    """
+    lanes = int.from_bytes(card_number.rjust(_LUHN_SWAR_WIDTH, '0').encode('ascii'), 'big')
+    lanes -= _LUHN_ASCII_ZEROS
+    
+    doubled = (lanes & _LUHN_DOUBLE_MASK) << 1
+    # Research: doubled + 6 carries into bit 4 exactly when doubled > 9
+    over_nine = ((doubled + _LUHN_LANE_SIXES) >> 4) & _LUHN_LANE_ONES
+    lanes = (lanes & ~_LUHN_DOUBLE_MASK) + doubled - 9 * over_nine
+    
+    # Research: Horizontal add - the top byte of lanes * 0x0101...01 is the lane sum
+    return ((lanes * _LUHN_LANE_ONES) >> (8 * (_LUHN_SWAR_WIDTH - 1))) & 0xff
 
 def luhn_check(card_number: str) -> bool:
     """
     Research: Luhn algorithm implementation for card validation
     Standard algorithm for payment card validation
     """
-    def digits_of(n):
-        return [int(d) for d in str(n)]
+    if (_LUHN_SWAR_MIN_LENGTH <= len(card_number) <= _LUHN_SWAR_WIDTH
+            and card_number.isascii() and card_number.isdigit()):
+        return _luhn_sum_swar(card_number) % 10 == 0
     
-    digits = digits_of(card_number)
-    odd_digits = digits[-1::-2]
-    even_digits = digits[-2::-2]
-    checksum = sum(odd_digits)
+    # Research: Generic fallback for non-standard lengths
+    if card_number.isascii() and card_number.isdigit():
+        digits = [ord(c) - 48 for c in card_number]
+    else:
+        digits = [int(c) for c in card_number]  # Research: Raises ValueError on non-digits
     
-    for d in even_digits:
-        checksum += sum(digits_of(d * 2))
+    # Research: Digit sum of 2d is 2d - 9 for d >= 5, so no per-digit re-splitting
+    checksum = sum(digits[-1::-2])
+    checksum += sum(2 * d - 9 if d >= 5 else 2 * d for d in digits[-2::-2])
     
     return checksum % 10 == 0
 
-def validate_expiry_date(expiry: str) -> bool:
-    """
-    Research: Comprehensive expiry date validation
-    """
+@lru_cache(maxsize=1024)
+def _validate_expiry_cached(expiry: str, current_year: int, current_month: int) -> bool:
+    """Research: Memoized expiry parsing keyed on the expiry string and current month"""
     try:
         if '/' not in expiry:
             return False
@@ -265,11 +494,12 @@ def validate_expiry_date(expiry: str) -> bool:
         # Research: Basic validation
         if month < 1 or month > 12:
             return False
+        
+        # Research: Accept both MM/YY and MM/YYYY by comparing full years
+        if year < 100:
+            year += 2000
             
         # Research: Future date validation
-        current_year = time.localtime().tm_year % 100
-        current_month = time.localtime().tm_mon
-        
         if year < current_year:
             return False
         elif year == current_year and month < current_month:
@@ -280,24 +510,39 @@ def validate_expiry_date(expiry: str) -> bool:
     except (ValueError, TypeError):
         return False
 
+def validate_expiry_date(expiry: str) -> bool:
+    """
+    Research: Comprehensive expiry date validation
+    """
+    if not isinstance(expiry, str):
+        return False
+    
+    # Research: Single localtime() call binned to (year, month) for the cache key
+    now = time.localtime()
+    return _validate_expiry_cached(expiry, now.tm_year, now.tm_mon)
+
 # Research: Performance monitoring decorator
 def research_performance_monitor(func):
     """
     Research decorator for performance monitoring
     Implements aspect-oriented programming for metrics collection
     """
+    # Research: Zero-overhead path - skip instrumentation entirely when INFO is disabled
+    if not app.logger.isEnabledFor(logging.INFO):
+        return func
+    
+    @wraps(func)
     def wrapper(*args, **kwargs):
         start_time = time.perf_counter()
-        start_memory = research_cache.hit_ratio()  # Using cache as memory proxy
         
         try:
             result = func(*args, **kwargs)
             execution_time = time.perf_counter() - start_time
             
-            # Research: Performance metrics collection
+            # Research: Performance metrics collection (lazy formatting)
             app.logger.info(
-                f"Performance: {func.__name__} took {execution_time:.4f}s, "
-                f"cache hit ratio: {research_cache.hit_ratio():.2f}"
+                "Performance: %s took %.4fs, cache hit ratio: %.2f",
+                func.__name__, execution_time, _discount_cache_hit_ratio()
             )
             
             return result
@@ -314,7 +559,7 @@ def research_performance_monitor(func):
 def index():
     """Research-optimized home page"""
     return render_template('index.html', 
-                         cache_performance=research_cache.hit_ratio())
+                         cache_performance=_discount_cache_hit_ratio())
 
 @app.route('/cart')
 @research_performance_monitor
@@ -324,11 +569,11 @@ def cart():
     cart_total = 0.00
     
     if 'cart' in session:
-        cart_total = calculate_cart_total_research(session['cart'])
+        cart_total = calculate_session_cart_total_research(session['cart'])
     
     return render_template('cart.html', 
                          cart_total=cart_total,
-                         cache_stats=research_cache.hit_ratio())
+                         cache_stats=_discount_cache_hit_ratio())
 
 @app.route('/api/calculate-total', methods=['POST'])
 @research_performance_monitor
@@ -345,7 +590,7 @@ def api_calculate_total():
             'total': total,
             'research_metrics': {
                 'calculation_method': 'research_optimized',
-                'cache_performance': research_cache.hit_ratio(),
+                'cache_performance': _discount_cache_hit_ratio(),
                 'items_processed': len(items)
             }
         })
@@ -356,7 +601,7 @@ def api_calculate_total():
             'error': str(e),
             'research_metrics': {
                 'error_type': type(e).__name__,
-                'cache_performance': research_cache.hit_ratio()
+                'cache_performance': _discount_cache_hit_ratio()
             }
         }), 400
 
@@ -377,7 +622,7 @@ def api_apply_discount():
             'discounted_total': discounted_total,
             'discount_applied': discounted_total != subtotal,
             'research_metrics': {
-                'cache_hit': research_cache.hit_ratio(),
+                'cache_hit': _discount_cache_hit_ratio(),
                 'discount_code': discount_code
             }
         })
@@ -392,12 +637,13 @@ def api_apply_discount():
 @research_performance_monitor
 def research_metrics():
     """Research endpoint for performance metrics"""
+    discount_cache_info = _apply_discount_cached.cache_info()
     return jsonify({
         'cache_performance': {
-            'hit_ratio': research_cache.hit_ratio(),
-            'total_hits': research_cache.hit_count,
-            'total_misses': research_cache.miss_count,
-            'current_size': len(research_cache.cache)
+            'hit_ratio': _discount_cache_hit_ratio(),
+            'total_hits': discount_cache_info.hits,
+            'total_misses': discount_cache_info.misses,
+            'current_size': discount_cache_info.currsize
         },
         'session_optimization': {
             'active_sessions': len(session) if session else 0